@@ -23,10 +23,13 @@ class Book(models.Model):
     - title: book title
     - publication_year: year of publication
     - author: ForeignKey to Author (each book belongs to one author)
+    - updated_at: last modification time, used to key cached representations
 
     Relationship details:
     - ForeignKey creates a one-to-many relationship: one Author -> many Books.
     - on_delete=models.CASCADE means deleting an Author deletes their Books too.
+    - db_index=True (the ForeignKey default, stated explicitly) backs the
+      `?author_id=` filter on the book list.
     """
     title = models.CharField(max_length=255)
     publication_year = models.IntegerField()
@@ -34,7 +37,9 @@ class Book(models.Model):
         Author,
         on_delete=models.CASCADE,
         related_name="books",
+        db_index=True,
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self) -> str:
         return f"{self.title} ({self.publication_year})"
@@ -1,23 +1,75 @@
+import copy
 from datetime import date
+from django.core.cache import cache
 from rest_framework import serializers
 from .models import Author, Book
 
 
-class BookSerializer(serializers.ModelSerializer):
+def book_cache_key(book) -> str:
+    """
+    Cache key for a book's serialized representation.
+
+    Book.updated_at changes on every save, so a stale entry is never read back;
+    it simply expires.
+    """
+    return f"book:{book.pk}:{book.updated_at.timestamp()}"
+
+
+class CachedFieldsMixin:
+    """
+    Builds ModelSerializer's field tree once per class; instances get copies.
+
+    Only the context-free tree is cached, on the class itself. Fields that
+    depend on context must be pruned from the copy in an override, as
+    AuthorSerializer.get_fields() does.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        # cls.__dict__, not getattr: a subclass must not reuse its parent's tree.
+        if "_cached_fields" not in cls.__dict__:
+            cls._cached_fields = super().get_fields()
+        return {
+            name: (
+                copy.deepcopy(field)
+                if isinstance(field, serializers.BaseSerializer)
+                else copy.copy(field)
+            )
+            for name, field in cls._cached_fields.items()
+        }
+
+
+class BookListSerializer(serializers.ListSerializer):
+    """
+    Used for `many=True` writes: validated books are inserted with
+    bulk_create, one INSERT per 500 rows instead of one per book.
+    """
+
+    def create(self, validated_data):
+        return Book.objects.bulk_create(
+            [Book(**item) for item in validated_data], batch_size=500
+        )
+
+
+class BookSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializes Book model fields for API responses and requests.
 
     Includes custom validation to prevent publication_year being set in the future.
+    Representations of saved books are cached, keyed by book_cache_key().
     """
 
     class Meta:
         model = Book
         fields = "__all__"
+        list_serializer_class = BookListSerializer
 
     def validate_publication_year(self, value: int) -> int:
         """
         Field-level validation: publication_year must not be in the future.
         """
+        # date.today() is a cheap C call, so checking it per item keeps the
+        # limit right across New Year without any refresh machinery.
         current_year = date.today().year
         if value > current_year:
             raise serializers.ValidationError(
@@ -25,18 +77,54 @@ class BookSerializer(serializers.ModelSerializer):
             )
         return value
 
+    def to_representation(self, instance):
+        if not isinstance(instance, Book) or instance.updated_at is None:
+            # Unsaved books and plain dicts of validated data
+            return super().to_representation(instance)
+        key = book_cache_key(instance)
+        data = cache.get(key)
+        if data is None:
+            data = super().to_representation(instance)
+            cache.set(key, data)
+        return data
+
+
+def include_books(request) -> bool:
+    """
+    Whether an API request opted in to nested books with `?include=books`.
+    """
+    return request.query_params.get("include") == "books"
+
 
-class AuthorSerializer(serializers.ModelSerializer):
+class AuthorSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializes Author plus related books using a nested serializer.
 
     `books` comes from Book.author.related_name="books" in the Book model.
-    read_only=True means you can view an author's books in responses,
+    It is read-only: you can view an author's books in responses,
     but you won't create/update books through this Author serializer.
+
+    For API requests the nested books are opt-in (`?include=books`), so plain
+    author listings don't serialize every book of every author. Views can
+    prefetch them into `prefetched_books` (Prefetch(..., to_attr=...)), a plain
+    list that is read directly instead of building a QuerySet per author.
     """
-    books = BookSerializer(many=True, read_only=True)
+    books = serializers.SerializerMethodField()
 
     class Meta:
         model = Author
         fields = ["id", "name", "books"]
 
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+        if request is not None and not include_books(request):
+            del fields["books"]
+        return fields
+
+    def get_books(self, obj):
+        books = getattr(obj, "prefetched_books", None)
+        if books is None:
+            books = obj.books.all()
+        return BookSerializer(books, many=True, context=self.context).data
+
@@ -1,19 +1,36 @@
+import json
+from datetime import date
+
 from django.test import TestCase
-from rest_framework.test import APIClient
-from .models import Book
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+from .models import Author, Book
+from .serializers import AuthorSerializer, BookSerializer
+from .views import BookCursorPagination
 
 
 class BookAPITest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        from django.contrib.auth.models import User
+
+        cls.user = User.objects.create_user(username='tester')
+        cls.author1, author2 = Author.objects.bulk_create(
+            [Author(name='Author 1'), Author(name='Author 2')]
+        )
+        Book.objects.bulk_create([
+            Book(title='Book A', publication_year=2000, author=cls.author1),
+            Book(title='Book B', publication_year=2001, author=author2),
+        ])
+
     def setUp(self):
         self.client = APIClient()
-        self.book1 = Book.objects.create(title='Book A', author='Author 1')
-        self.book2 = Book.objects.create(title='Book B', author='Author 2')
 
     def test_list_books(self):
-        response = self.client.get('/api/books/')
+        response = self.client.get('/api/books/list/')
         self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIsInstance(data, list)
+        data = response.json()['results']
         self.assertEqual(len(data), 2)
         for item in data:
             self.assertIn('id', item)
@@ -22,42 +39,251 @@ class BookAPITest(TestCase):
 
     def test_create_book_requires_auth(self):
         # Unauthenticated requests should be denied for create
-        data = {'title': 'Book C', 'author': 'Author 3'}
-        response = self.client.post('/api/books_all/', data, format='json')
+        data = [{'title': 'Book C', 'publication_year': 2002, 'author': self.author1.pk}]
+        response = self.client.post('/api/books/bulk/', data, format='json')
         self.assertIn(response.status_code, (401, 403))
         self.assertEqual(Book.objects.count(), 2)
 
-    def test_crud_with_token(self):
-        # Create a user and obtain a token
-        from django.contrib.auth.models import User
-        from rest_framework.authtoken.models import Token
-
-        user = User.objects.create_user(username='tester', password='pass')
-        resp = self.client.post('/api/token-auth/', {'username': 'tester', 'password': 'pass'}, format='json')
-        self.assertEqual(resp.status_code, 200)
-        token = resp.json().get('token')
-        self.assertIsNotNone(token)
+    def test_create_retrieve_delete(self):
+        self.client.force_authenticate(self.user)
 
-        # Authenticate with token and create
-        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token}')
-        data = {'title': 'Book C', 'author': 'Author 3'}
-        resp = self.client.post('/api/books_all/', data, format='json')
+        # Create
+        data = [{'title': 'Book C', 'publication_year': 2002, 'author': self.author1.pk}]
+        resp = self.client.post('/api/books/bulk/', data, format='json')
         self.assertEqual(resp.status_code, 201)
-        created_id = resp.json().get('id')
+        created_id = resp.json()[0].get('id')
         self.assertIsNotNone(created_id)
 
         # Retrieve
-        resp = self.client.get(f'/api/books_all/{created_id}/')
+        resp = self.client.get(f'/api/books/{created_id}/')
         self.assertEqual(resp.status_code, 200)
         self.assertEqual(resp.json().get('title'), 'Book C')
 
-        # Update
-        payload = {'title': 'Book C Updated', 'author': 'Author 3'}
-        resp = self.client.put(f'/api/books_all/{created_id}/', payload, format='json')
-        self.assertEqual(resp.status_code, 200)
-        self.assertEqual(resp.json().get('title'), 'Book C Updated')
-
         # Delete
-        resp = self.client.delete(f'/api/books_all/{created_id}/')
+        resp = self.client.delete(f'/api/books/{created_id}/delete/')
         self.assertEqual(resp.status_code, 204)
-        self.assertEqual(Book.objects.filter(id=created_id).count(), 0)
+        self.assertFalse(Book.objects.filter(id=created_id).exists())
+
+
+class AuthorAPITest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        authors = Author.objects.bulk_create(
+            [Author(name=name) for name in ('Author 1', 'Author 2', 'Author 3')]
+        )
+        Book.objects.bulk_create(
+            [Book(title=f'{a.name} Book', publication_year=2000, author=a) for a in authors]
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_list_authors_omits_books_by_default(self):
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/authors/')
+        self.assertEqual(response.status_code, 200)
+        for item in response.json():
+            self.assertNotIn('books', item)
+
+    def test_list_authors_prefetches_books(self):
+        # One query for the authors, one for all of their books
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/authors/', {'include': 'books'})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(len(data), 3)
+        for item in data:
+            self.assertEqual(len(item['books']), 1)
+
+    def test_serializer_fields_are_not_shared_between_instances(self):
+        first = AuthorSerializer().fields
+        second = AuthorSerializer().fields
+        self.assertEqual(list(first), ['id', 'name', 'books'])
+        self.assertEqual(list(first), list(second))
+        self.assertIsNot(first['name'], second['name'])
+        self.assertIsInstance(first['name'].parent, AuthorSerializer)
+
+    def test_context_pruned_fields_do_not_leak_into_cache(self):
+        request = Request(APIRequestFactory().get('/api/authors/'))
+        pruned = AuthorSerializer(context={'request': request}).fields
+        self.assertNotIn('books', pruned)
+        self.assertIn('books', AuthorSerializer().fields)
+
+
+class SerializerTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(name='Author 1')
+
+    def test_author_serializer_includes_nested_books(self):
+        Book.objects.create(title='Book A', publication_year=2000, author=self.author)
+        data = AuthorSerializer(self.author).data
+        self.assertEqual([book['title'] for book in data['books']], ['Book A'])
+
+    def test_future_publication_year_rejected(self):
+        data = {'title': 'Book A', 'publication_year': date.today().year + 1, 'author': self.author.pk}
+        serializer = BookSerializer(data=data)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('publication_year', serializer.errors)
+
+    def test_current_publication_year_accepted(self):
+        data = {'title': 'Book A', 'publication_year': date.today().year, 'author': self.author.pk}
+        self.assertTrue(BookSerializer(data=data).is_valid())
+
+
+class BookDetailAPITest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        author = Author.objects.create(name='Author 1')
+        cls.book = Book.objects.create(title='Book A', publication_year=2000, author=author)
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_retrieve_sets_etag(self):
+        response = self.client.get(f'/api/books/{self.book.pk}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], 'Book A')
+        self.assertIn('ETag', response)
+
+    def test_matching_etag_returns_not_modified(self):
+        etag = self.client.get(f'/api/books/{self.book.pk}/')['ETag']
+        response = self.client.get(f'/api/books/{self.book.pk}/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_weak_and_wildcard_etags_return_not_modified(self):
+        etag = self.client.get(f'/api/books/{self.book.pk}/')['ETag']
+        for header in (f'W/{etag}', '*'):
+            with self.assertNumQueries(1):
+                response = self.client.get(f'/api/books/{self.book.pk}/', HTTP_IF_NONE_MATCH=header)
+            self.assertEqual(response.status_code, 304)
+
+    def test_unrelated_etag_substring_does_not_match(self):
+        etag = self.client.get(f'/api/books/{self.book.pk}/')['ETag']
+        response = self.client.get(
+            f'/api/books/{self.book.pk}/', HTTP_IF_NONE_MATCH=f'"x{etag[1:-1]}x"'
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_missing_book_is_not_found(self):
+        response = self.client.get(f'/api/books/{self.book.pk + 1}/', HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, 404)
+
+    def test_etag_changes_after_update(self):
+        etag = self.client.get(f'/api/books/{self.book.pk}/')['ETag']
+        self.book.title = 'Book A Revised'
+        self.book.save()
+        response = self.client.get(f'/api/books/{self.book.pk}/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], 'Book A Revised')
+
+
+class BookListAPITest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author1, author2 = Author.objects.bulk_create(
+            [Author(name='Author 1'), Author(name='Author 2')]
+        )
+        Book.objects.bulk_create([
+            Book(title='Book A', publication_year=2000, author=cls.author1),
+            Book(title='Book B', publication_year=2001, author=author2),
+        ])
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_filter_by_author_id(self):
+        response = self.client.get('/api/books/list/', {'author_id': self.author1.pk})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['title'] for item in response.json()['results']], ['Book A'])
+
+    def test_invalid_author_id_rejected(self):
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/books/list/', {'author_id': 'abc'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('author_id', response.json())
+
+    def test_list_matches_serializer_output(self):
+        response = self.client.get('/api/books/list/')
+        self.assertEqual(response.status_code, 200)
+        expected = BookSerializer(Book.objects.order_by('-id'), many=True).data
+        self.assertEqual(response.json()['results'], json.loads(JSONRenderer().render(expected)))
+
+    def test_list_uses_cursor_pagination(self):
+        Book.objects.bulk_create([
+            Book(title=f'Book {i}', publication_year=2000, author=self.author1)
+            for i in range(BookCursorPagination.page_size)
+        ])
+        first = self.client.get('/api/books/list/').json()
+        self.assertEqual(len(first['results']), BookCursorPagination.page_size)
+        self.assertIsNotNone(first['next'])
+        second = self.client.get(first['next']).json()
+        self.assertEqual(len(second['results']), 2)
+        self.assertIsNone(second['next'])
+        seen = [item['id'] for item in first['results'] + second['results']]
+        self.assertEqual(seen, sorted(seen, reverse=True))
+
+    def test_bulk_create_requires_auth(self):
+        data = [{'title': 'Book C', 'publication_year': 2002, 'author': self.author1.pk}]
+        response = self.client.post('/api/books/bulk/', data, format='json')
+        self.assertIn(response.status_code, (401, 403))
+
+    def test_bulk_create(self):
+        from django.contrib.auth.models import User
+
+        self.client.force_authenticate(User.objects.create_user(username='tester'))
+        data = [
+            {'title': f'Book {i}', 'publication_year': 2002, 'author': self.author1.pk}
+            for i in range(3)
+        ]
+        response = self.client.post('/api/books/bulk/', data, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.json()), 3)
+        self.assertTrue(all(item['id'] for item in response.json()))
+        self.assertEqual(Book.objects.filter(author=self.author1).count(), 4)
+
+    def test_bulk_create_rejects_invalid_item(self):
+        from django.contrib.auth.models import User
+
+        self.client.force_authenticate(User.objects.create_user(username='tester'))
+        data = [
+            {'title': 'Book C', 'publication_year': 2002, 'author': self.author1.pk},
+            {'title': 'Book D', 'publication_year': date.today().year + 1, 'author': self.author1.pk},
+        ]
+        response = self.client.post('/api/books/bulk/', data, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Book.objects.count(), 2)
+
+    def test_author_id_filter_uses_index(self):
+        plan = Book.objects.filter(author_id=self.author1.pk).explain()
+        self.assertIn('INDEX', plan.upper())
+
+
+class BookDeleteAPITest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        from django.contrib.auth.models import User
+
+        cls.user = User.objects.create_user(username='tester')
+        author = Author.objects.create(name='Author 1')
+        cls.book = Book.objects.create(title='Book A', publication_year=2000, author=author)
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_delete_requires_auth(self):
+        response = self.client.delete(f'/api/books/{self.book.pk}/delete/')
+        self.assertIn(response.status_code, (401, 403))
+        self.assertTrue(Book.objects.filter(pk=self.book.pk).exists())
+
+    def test_delete_is_single_query(self):
+        self.client.force_authenticate(self.user)
+        with self.assertNumQueries(1):
+            response = self.client.delete(f'/api/books/{self.book.pk}/delete/')
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(Book.objects.filter(pk=self.book.pk).exists())
+
+    def test_delete_missing_book(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.delete(f'/api/books/{self.book.pk + 1}/delete/')
+        self.assertEqual(response.status_code, 404)
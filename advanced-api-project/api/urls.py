@@ -1,5 +1,16 @@
 from django.urls import path
+from .views import (
+    AuthorListView,
+    BookBulkCreateView,
+    BookDeleteView,
+    BookDetailView,
+    BookListView,
+)
 
 urlpatterns = [
-    # No endpoints required yet for the serializers/models task.
+    path("books/list/", BookListView.as_view(), name="book-list"),
+    path("books/bulk/", BookBulkCreateView.as_view(), name="book-bulk-create"),
+    path("books/<int:pk>/", BookDetailView.as_view(), name="book-detail"),
+    path("books/<int:pk>/delete/", BookDeleteView.as_view(), name="book-delete"),
+    path("authors/", AuthorListView.as_view(), name="author-list"),
 ]
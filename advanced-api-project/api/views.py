@@ -1,17 +1,45 @@
-from rest_framework import generics
-from .models import Book
-from .serializers import BookSerializer
+from django.db.models import Prefetch
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from rest_framework import generics, permissions, status
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+from .models import Author, Book
+from .serializers import AuthorSerializer, BookSerializer, include_books
+
+class BookCursorPagination(CursorPagination):
+    """
+    Keyset pagination on the primary key: each page is
+    `WHERE id < <last seen> ORDER BY id DESC LIMIT 50`, so deep pages cost the
+    same as the first instead of scanning past an ever-growing OFFSET.
+    """
+    ordering = "-id"
+    page_size = 50
+
 
 class BookListView(generics.ListAPIView):
     serializer_class = BookSerializer
+    pagination_class = BookCursorPagination
 
     def get_queryset(self):
         """
         Optional filters:
         /api/books/?search=<text>
+        /api/books/?author_id=<id>
         """
         qs = Book.objects.all()
 
+        author_id = self.request.query_params.get("author_id")
+        if author_id:
+            # Coerce once up front so malformed input is a 400, not a DB error.
+            try:
+                author_id = int(author_id)
+            except ValueError:
+                raise ValidationError({"author_id": "A valid integer is required."})
+            # Filter on the indexed author_id column directly; no join needed.
+            qs = qs.filter(author_id=author_id)
+
         search = self.request.query_params.get("search")
         if search:
             # Adjust field name(s) to match your model:
@@ -19,3 +47,91 @@ class BookListView(generics.ListAPIView):
 
         return qs
 
+    def list(self, request, *args, **kwargs):
+        """
+        Read-only fast path: rows come straight from .values() as dicts with
+        the same keys BookSerializer emits, skipping model instantiation and
+        per-object serializer work.
+        """
+        rows = self.filter_queryset(self.get_queryset()).values(
+            "id", "title", "publication_year", "updated_at", "author"
+        )
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(list(page))
+        return Response(list(rows))
+
+
+def book_detail_etag(request, pk=None, *args, **kwargs):
+    """
+    ETag for one book, from its updated_at column alone; None (no tag) when
+    the book doesn't exist, so the view answers with its usual 404.
+    """
+    updated_at = Book.objects.filter(pk=pk).values_list("updated_at", flat=True).first()
+    if updated_at is None:
+        return None
+    return f"book-{pk}-{updated_at.timestamp()}"
+
+
+@method_decorator(condition(etag_func=book_detail_etag), name="retrieve")
+class BookDetailView(generics.RetrieveAPIView):
+    """
+    Same response as RetrieveAPIView, plus an ETag. Django's condition()
+    handles If-None-Match (including `*` and weak validators), so a
+    matching request gets a 304 before the book is loaded or serialized.
+    """
+    queryset = Book.objects.all()
+    serializer_class = BookSerializer
+
+
+class BookDeleteView(generics.DestroyAPIView):
+    queryset = Book.objects.all()
+    serializer_class = BookSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def destroy(self, request, *args, **kwargs):
+        """
+        Deletes with a single `DELETE ... WHERE id = ?` instead of fetching the
+        book first. Book has no object-level permissions, and
+        check_permissions() has already run by the time destroy() is called.
+        """
+        deleted, _ = Book.objects.filter(pk=kwargs["pk"]).delete()
+        if not deleted:
+            raise NotFound()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class BookBulkCreateView(generics.CreateAPIView):
+    """
+    Creates several books from a JSON list in one request.
+    """
+    serializer_class = BookSerializer
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs["many"] = True
+        return super().get_serializer(*args, **kwargs)
+
+
+class AuthorListView(generics.ListAPIView):
+    serializer_class = AuthorSerializer
+
+    def get_queryset(self):
+        """
+        Optional nesting:
+        /api/authors/?include=books
+
+        When nested, the books are prefetched in one `WHERE author_id IN (...)`
+        query instead of one query per author.
+        """
+        qs = Author.objects.all()
+        if include_books(self.request):
+            qs = qs.prefetch_related(
+                Prefetch(
+                    "books",
+                    queryset=Book.objects.only(
+                        "id", "title", "publication_year", "author_id", "updated_at"
+                    ),
+                    to_attr="prefetched_books",
+                )
+            )
+        return qs
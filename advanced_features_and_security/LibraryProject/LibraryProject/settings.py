@@ -168,6 +168,25 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+# Rendered relationship_app pages live in their own cache. Catalogue pages
+# are stored under a version that moves on whenever a book or author
+# changes. LocMemCache is per process, so with more than one worker point
+# 'pages' at Memcached or Redis; otherwise each worker only sees its own
+# invalidations until the page timeout runs out.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'pages': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'pages',
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -186,11 +205,35 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# https://docs.djangoproject.com/en/6.0/topics/auth/passwords/
+# New passwords are hashed with scrypt from the standard library. Its
+# defaults are memory-hard and take less CPU per hash than PBKDF2's default
+# iteration count, so register() and logins hold a worker for less time.
+# PBKDF2 stays listed so existing hashes still verify; they are upgraded to
+# scrypt the next time each user logs in.
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
 # Custom User Model Configuration
 # Point to the custom user model in bookshelf app
 AUTH_USER_MODEL = 'bookshelf.CustomUser'
 
 
+# Authentication backends
+# https://docs.djangoproject.com/en/6.0/ref/settings/#authentication-backends
+# Replaces ModelBackend with a subclass that fetches the user's profile in
+# the same query, so role checks on request.user don't hit the database.
+
+AUTHENTICATION_BACKENDS = [
+    'relationship_app.backends.UserProfileBackend',
+]
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/6.0/topics/i18n/
 
@@ -0,0 +1,15 @@
+"""
+Settings for running the test suite.
+
+Usage: python manage.py test --settings=LibraryProject.settings_test
+
+Identical to the main settings except that passwords are hashed with MD5,
+so creating users and logging in with real passwords doesn't spend most of
+a test's time in PBKDF2. Never use these settings outside of tests.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
@@ -5,7 +5,7 @@ from .models import Book, CustomUser
 
 class CustomUserAdmin(UserAdmin):
     """Custom admin for CustomUser model."""
-    list_display = ("email", "username", "date_of_birth", "is_staff", "is_superuser")
+    list_display = ("email", "username", "dob", "is_staff", "is_superuser")
     list_filter = ("is_staff", "is_superuser", "date_of_birth")
     search_fields = ("email", "username")
     fieldsets = (
@@ -21,6 +21,11 @@ class CustomUserAdmin(UserAdmin):
         }),
     )
 
+    @admin.display(description="Date of birth", ordering="date_of_birth")
+    def dob(self, obj):
+        """Render the date as plain ISO text, skipping per-row locale formatting."""
+        return obj.date_of_birth and obj.date_of_birth.strftime("%Y-%m-%d")
+
 
 @admin.register(Book)
 class BookAdmin(admin.ModelAdmin):
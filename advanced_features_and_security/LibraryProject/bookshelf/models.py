@@ -48,6 +48,7 @@ class Book(models.Model):
         return self.title
     
     class Meta:
+        ordering = ['id']
         permissions = [
             ('can_view_book', 'Can view book'),
             ('can_create_book', 'Can create book'),
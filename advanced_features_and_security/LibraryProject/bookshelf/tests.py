@@ -1,3 +1,293 @@
-from django.test import TestCase
+"""
+Security tests for the bookshelf views.
 
-# Create your tests here.
+Covers CSRF protection, SQL injection resistance of the search, list
+pagination, permission enforcement, input validation/escaping and the
+security response headers.
+
+Users, groups, permissions and books never change during a test, so each
+class creates them once in setUpTestData(); Django wraps every test in a
+savepoint and rolls it back, so tests still see a fresh copy of that data.
+Only per-test state (the client and its session) lives in setUp().
+
+Fixture users have no usable password and are logged in with force_login(),
+so no test pays for password hashing.
+
+SECURE_SSL_REDIRECT is turned off so the test client's plain-HTTP requests
+reach the views instead of being redirected to HTTPS.
+"""
+
+from functools import lru_cache
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import PermissionDenied
+from django.test import Client, RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from . import views
+from .models import Book, CustomUser
+from .views import BOOKS_PER_PAGE
+
+
+# Content types and permissions are created by migrations and never change
+# during the run, so each is looked up once for the whole module.
+@lru_cache(maxsize=None)
+def _book_ct():
+    return ContentType.objects.get_for_model(Book)
+
+
+@lru_cache(maxsize=None)
+def _perm(codename):
+    return Permission.objects.get(content_type=_book_ct(), codename=codename)
+
+
+# URL patterns are fixed for the run too, so each name/args pair is
+# resolved once and reused by every test that requests it.
+@lru_cache(maxsize=None)
+def _url(name, *args):
+    return reverse(name, args=args)
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class CSRFProtectionTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
+            email='editor@example.com', username='editor'
+        )
+        cls.user.user_permissions.add(_perm('can_view_book'), _perm('can_create_book'))
+
+    def setUp(self):
+        self.client = Client(enforce_csrf_checks=True)
+        self.client.force_login(self.user)
+
+    def test_post_without_csrf_token_rejected(self):
+        data = {'title': 'No Token', 'author': 'Anon', 'publication_year': 2020}
+        response = self.client.post(_url('book-create'), data)
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Book.objects.filter(title='No Token').exists())
+
+    def test_get_csrf_token_from_form(self):
+        response = self.client.get(_url('book-create'))
+        self.assertContains(response, 'csrfmiddlewaretoken')
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class SQLInjectionTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
+            email='viewer@example.com', username='viewer'
+        )
+        cls.user.user_permissions.add(_perm('can_view_book'))
+        cls.book = Book.objects.create(
+            title='Django for Beginners', author='William Vincent', publication_year=2018
+        )
+
+    def setUp(self):
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def test_search_with_drop_table_injection(self):
+        response = self.client.get(
+            _url('book-list'), {'search': "'; DROP TABLE bookshelf_book; --"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(Book.objects.exists())
+
+    def test_search_with_valid_input_works(self):
+        with self.assertNumQueries(6):
+            response = self.client.get(_url('book-list'), {'search': 'Django'})
+        self.assertContains(response, 'Django for Beginners')
+
+    def test_single_character_search_is_ignored(self):
+        Book.objects.create(title='Refactoring', author='Martin Fowler', publication_year=2018)
+        response = self.client.get(_url('book-list'), {'search': 'D'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['search_query'], '')
+        self.assertEqual(response.context['page'].paginator.count, 2)
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class BookListPaginationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
+            email='viewer@example.com', username='viewer'
+        )
+        cls.user.user_permissions.add(_perm('can_view_book'))
+        Book.objects.bulk_create(
+            Book(title=f'Book {i}', author='Author', publication_year=2000)
+            for i in range(BOOKS_PER_PAGE + 1)
+        )
+
+    def setUp(self):
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def test_first_page_is_capped(self):
+        response = self.client.get(_url('book-list'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['books']), BOOKS_PER_PAGE)
+        self.assertTrue(response.context['page'].has_next())
+
+    def test_list_query_count_does_not_grow_with_books(self):
+        # Session, user, user and group permissions, page count, page rows.
+        with self.assertNumQueries(6):
+            self.client.get(_url('book-list'))
+
+    def test_second_page_holds_the_rest(self):
+        response = self.client.get(_url('book-list'), {'page': 2})
+        books = list(response.context['books'])
+        self.assertEqual(len(books), 1)
+        self.assertEqual(books[0].title, f'Book {BOOKS_PER_PAGE}')
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class PermissionEnforcementTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        view_perm = _perm('can_view_book')
+        create_perm = _perm('can_create_book')
+
+        # Every row goes in with bulk_create(), so the whole fixture costs a
+        # handful of INSERTs instead of one per user, group and link.
+        viewer_group, editor_group = Group.objects.bulk_create([
+            Group(name='Viewers'), Group(name='Editors'),
+        ])
+        GroupPermission = Group.permissions.through
+        GroupPermission.objects.bulk_create([
+            GroupPermission(group=viewer_group, permission=view_perm),
+            GroupPermission(group=editor_group, permission=view_perm),
+            GroupPermission(group=editor_group, permission=create_perm),
+        ])
+
+        cls.viewer, cls.editor, cls.no_perms = CustomUser.objects.bulk_create([
+            CustomUser(email='viewer@example.com', username='viewer', password=make_password(None)),
+            CustomUser(email='editor@example.com', username='editor', password=make_password(None)),
+            CustomUser(email='noperms@example.com', username='noperms', password=make_password(None)),
+        ])
+        UserGroup = CustomUser.groups.through
+        UserGroup.objects.bulk_create([
+            UserGroup(customuser=cls.viewer, group=viewer_group),
+            UserGroup(customuser=cls.editor, group=editor_group),
+        ])
+
+        cls.book = Book.objects.create(
+            title='Two Scoops of Django', author='Daniel Feldroy', publication_year=2020
+        )
+
+    def setUp(self):
+        self.client = Client()
+        self.factory = RequestFactory()
+
+    def _get(self, view, user, *args):
+        """
+        Call a view directly with a RequestFactory GET, skipping the
+        session and auth middleware. Tests that redirect or flash messages
+        keep using the full Client stack.
+        """
+        request = self.factory.get('/')
+        request.user = user
+        return view(request, *args)
+
+    def test_user_without_permission_denied(self):
+        with self.assertRaises(PermissionDenied):
+            self._get(views.book_list, self.no_perms)
+
+    def test_viewer_can_access_list_and_detail(self):
+        # User and group permissions (cached on the user afterwards), then
+        # the page count and the page rows.
+        with self.assertNumQueries(4):
+            response = self._get(views.book_list, self.viewer)
+        self.assertEqual(response.status_code, 200)
+        with self.assertNumQueries(1):
+            response = self._get(views.book_detail, self.viewer, self.book.pk)
+        self.assertEqual(response.status_code, 200)
+
+    def test_viewer_cannot_create(self):
+        with self.assertRaises(PermissionDenied):
+            self._get(views.book_create, self.viewer)
+
+    def test_editor_can_create(self):
+        self.client.force_login(self.editor)
+        data = {'title': 'New Book', 'author': 'New Author', 'publication_year': 2021}
+        response = self.client.post(_url('book-create'), data)
+        self.assertRedirects(response, _url('book-list'))
+        self.assertTrue(Book.objects.filter(title='New Book').exists())
+
+    def test_editor_cannot_delete(self):
+        self.client.force_login(self.editor)
+        response = self.client.post(_url('book-delete', self.book.pk))
+        self.assertEqual(response.status_code, 403)
+        self.assertTrue(Book.objects.filter(pk=self.book.pk).exists())
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class InputValidationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        all_perms = [
+            _perm(codename)
+            for codename in ('can_view_book', 'can_create_book', 'can_edit_book', 'can_delete_book')
+        ]
+        all_group = Group.objects.create(name='Admins')
+        all_group.permissions.set(all_perms)
+
+        cls.user = CustomUser.objects.create_user(
+            email='admin@example.com', username='admin'
+        )
+        cls.user.groups.add(all_group)
+
+    def setUp(self):
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def test_non_numeric_publication_year_rejected(self):
+        data = {'title': 'Bad Year', 'author': 'Someone', 'publication_year': 'abc'}
+        response = self.client.post(_url('book-create'), data)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Book.objects.filter(title='Bad Year').exists())
+
+    def test_overlong_title_rejected(self):
+        data = {'title': 'x' * 201, 'author': 'Someone', 'publication_year': 2020}
+        response = self.client.post(_url('book-create'), data)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Book.objects.count(), 0)
+
+    def test_xss_attempt_in_title_escaped(self):
+        xss_payload = '<script>alert("xss")</script>'
+        data = {'title': xss_payload, 'author': 'Someone', 'publication_year': 2020}
+        response = self.client.post(_url('book-create'), data)
+        self.assertEqual(response.status_code, 302)
+        book = Book.objects.order_by('-id').first()
+        self.assertEqual(book.title, xss_payload)
+
+        response = self.client.get(_url('book-detail', book.pk))
+        self.assertContains(response, '&lt;script&gt;')
+        self.assertNotContains(response, xss_payload)
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class HeadersOnlyTests(SimpleTestCase):
+    """
+    Header checks need no database rows, so they run against the
+    permission-free example view as an anonymous user and skip TestCase's
+    per-test transaction entirely. SimpleTestCase fails the test if any
+    query is issued.
+    """
+
+    def test_x_frame_options_header_present(self):
+        response = self.client.get(_url('example'))
+        self.assertEqual(response['X-Frame-Options'], 'DENY')
+
+    def test_x_content_type_options_header_present(self):
+        response = self.client.get(_url('example'))
+        self.assertEqual(response['X-Content-Type-Options'], 'nosniff')
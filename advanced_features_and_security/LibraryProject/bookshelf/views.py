@@ -1,6 +1,7 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import permission_required
 from django.contrib import messages
+from django.core.paginator import Paginator
 from django.views.decorators.http import require_http_methods
 from django.db.models import Q
 from .models import Book
@@ -30,6 +31,9 @@ Users must be assigned to groups (Viewers, Editors, Admins) that have these
 permissions assigned to access respective views.
 """
 
+BOOKS_PER_PAGE = 25
+MIN_SEARCH_LENGTH = 2
+
 
 @permission_required('bookshelf.can_view_book', raise_exception=True)
 def book_list(request):
@@ -42,10 +46,17 @@ def book_list(request):
     - Permission check ensures user can view books
     - Search query parameterized (not concatenated into SQL)
     
+    Results are paginated BOOKS_PER_PAGE at a time.
+    
     Requires: can_view_book permission
     """
     books = Book.objects.all()
-    search_query = request.GET.get('search', '').strip()
+    search_query = request.GET.get('search')
+    search_query = search_query.strip() if search_query else ''
+    # One-character terms match nearly every row, so they are ignored
+    # rather than paying for a full-table ILIKE scan.
+    if len(search_query) < MIN_SEARCH_LENGTH:
+        search_query = ''
     
     # SECURE SEARCH IMPLEMENTATION
     # Using Django ORM's Q objects with parameterized queries
@@ -57,8 +68,11 @@ def book_list(request):
             Q(author__icontains=search_query)
         )
     
+    page = Paginator(books, BOOKS_PER_PAGE).get_page(request.GET.get('page'))
+    
     context = {
-        'books': books,
+        'page': page,
+        'books': page.object_list,
         'search_query': search_query,
     }
     return render(request, 'bookshelf/book_list.html', context)
@@ -166,77 +180,6 @@ def book_delete(request, pk):
     return render(request, 'bookshelf/book_confirm_delete.html', context)
 
 
-@permission_required('bookshelf.can_view_book', raise_exception=True)
-def book_detail(request, pk):
-    """
-    View to display details of a specific book.
-    Requires: can_view_book permission
-    """
-    book = get_object_or_404(Book, pk=pk)
-    context = {'book': book}
-    return render(request, 'bookshelf/book_detail.html', context)
-
-
-@permission_required('bookshelf.can_create_book', raise_exception=True)
-@require_http_methods(["GET", "POST"])
-def book_create(request):
-    """
-    View to create a new book.
-    Requires: can_create_book permission
-    """
-    if request.method == 'POST':
-        form = BookForm(request.POST)
-        if form.is_valid():
-            form.save()
-            messages.success(request, 'Book created successfully!')
-            return redirect('book-list')
-    else:
-        form = BookForm()
-    
-    context = {'form': form, 'action': 'Create'}
-    return render(request, 'bookshelf/book_form.html', context)
-
-
-@permission_required('bookshelf.can_edit_book', raise_exception=True)
-@require_http_methods(["GET", "POST"])
-def book_edit(request, pk):
-    """
-    View to edit an existing book.
-    Requires: can_edit_book permission
-    """
-    book = get_object_or_404(Book, pk=pk)
-    
-    if request.method == 'POST':
-        form = BookForm(request.POST, instance=book)
-        if form.is_valid():
-            form.save()
-            messages.success(request, 'Book updated successfully!')
-            return redirect('book-detail', pk=book.pk)
-    else:
-        form = BookForm(instance=book)
-    
-    context = {'form': form, 'book': book, 'action': 'Edit'}
-    return render(request, 'bookshelf/book_form.html', context)
-
-
-@permission_required('bookshelf.can_delete_book', raise_exception=True)
-@require_http_methods(["GET", "POST"])
-def book_delete(request, pk):
-    """
-    View to delete a book.
-    Requires: can_delete_book permission
-    """
-    book = get_object_or_404(Book, pk=pk)
-    
-    if request.method == 'POST':
-        book.delete()
-        messages.success(request, 'Book deleted successfully!')
-        return redirect('book-list')
-    
-    context = {'book': book}
-    return render(request, 'bookshelf/book_confirm_delete.html', context)
-
-
 @require_http_methods(["GET", "POST"])
 def example_view(request):
     """Simple example view demonstrating ExampleForm usage."""
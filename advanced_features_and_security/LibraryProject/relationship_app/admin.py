@@ -2,9 +2,48 @@ from django.contrib import admin
 from .models import Author, Book, Library, Librarian, UserProfile
 
 
-# Admin registrations for all models
-admin.site.register(Author)
-admin.site.register(Book)
-admin.site.register(Library)
-admin.site.register(Librarian)
-admin.site.register(UserProfile)
+# Changelists that show a related object join it in the page query
+# (list_select_related) instead of issuing one query per row, and every
+# changelist is capped at 50 rows per page. Foreign keys use raw id inputs
+# so change forms don't load every possible target into a <select>.
+
+@admin.register(Author)
+class AuthorAdmin(admin.ModelAdmin):
+    list_display = ("name",)
+    list_per_page = 50
+    search_fields = ("name",)
+
+
+@admin.register(Book)
+class BookAdmin(admin.ModelAdmin):
+    list_display = ("title", "author_name")
+    list_per_page = 50
+    search_fields = ("title", "author_name")
+    raw_id_fields = ("author",)
+
+
+@admin.register(Library)
+class LibraryAdmin(admin.ModelAdmin):
+    list_display = ("name",)
+    list_per_page = 50
+    search_fields = ("name",)
+    raw_id_fields = ("books",)
+
+
+@admin.register(Librarian)
+class LibrarianAdmin(admin.ModelAdmin):
+    list_display = ("name", "library")
+    list_select_related = ("library",)
+    list_per_page = 50
+    search_fields = ("name", "library__name")
+    raw_id_fields = ("library",)
+
+
+@admin.register(UserProfile)
+class UserProfileAdmin(admin.ModelAdmin):
+    list_display = ("user", "role")
+    list_select_related = ("user",)
+    list_per_page = 50
+    list_filter = ("role",)
+    search_fields = ("user__username",)
+    raw_id_fields = ("user",)
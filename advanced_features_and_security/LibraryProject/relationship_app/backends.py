@@ -0,0 +1,26 @@
+"""
+Authentication backends for relationship_app
+
+This module defines an authentication backend that loads the user's
+UserProfile together with the user, so role checks need no extra query.
+"""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+
+class UserProfileBackend(ModelBackend):
+    """
+    ModelBackend that joins the user's profile when restoring the user
+    from the session. The role predicates in views.py read
+    user.userprofile.role, which then comes from the same row instead of
+    a second SELECT on every protected request.
+    """
+
+    def get_user(self, user_id):
+        UserModel = get_user_model()
+        try:
+            user = UserModel._default_manager.select_related('userprofile').get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,56 @@
+"""
+Page caching helpers for relationship_app
+
+Rendered pages are stored in the 'pages' cache alias. Pages built from
+books and authors are stored under the current catalogue version, and
+invalidate_catalogue() moves that version on, so every cached catalogue
+page goes stale at once without touching the rest of the cache.
+"""
+
+import time
+
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+
+
+PAGE_CACHE_ALIAS = 'pages'
+CATALOGUE_VERSION_KEY = 'catalogue_version'
+
+
+def catalogue_version():
+    """
+    Return the current catalogue version. A missing or evicted version is
+    replaced with a new timestamp rather than reset to a fixed value, so
+    pages cached under an older version can never be picked up again.
+    """
+    return caches[PAGE_CACHE_ALIAS].get_or_set(
+        CATALOGUE_VERSION_KEY, time.time_ns, timeout=None
+    )
+
+
+def invalidate_catalogue():
+    """
+    Move the catalogue version on. Pages cached under the old version are
+    no longer read and expire on their own timeout.
+    """
+    caches[PAGE_CACHE_ALIAS].set(CATALOGUE_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def render_cached(key, template_name, get_context, timeout, version=None):
+    """
+    Return an HttpResponse with the rendered template, reusing the body
+    cached under key (and version) when there is one. get_context is only
+    called on a miss, so a cached page runs no queries. Only the body is
+    cached; response headers are left to the view.
+
+    The body is shared by every user who can reach the key, so it is
+    rendered without the request: context processors (user, csrf_token,
+    messages) don't run and can't leak one user's data to another.
+    """
+    cache = caches[PAGE_CACHE_ALIAS]
+    content = cache.get(key, version=version)
+    if content is None:
+        content = render_to_string(template_name, get_context())
+        cache.set(key, content, timeout, version=version)
+    return HttpResponse(content)
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:05
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def fill_author_name(apps, schema_editor):
+    Author = apps.get_model('relationship_app', 'Author')
+    Book = apps.get_model('relationship_app', 'Book')
+    Book.objects.update(
+        author_name=Subquery(
+            Author.objects.filter(pk=OuterRef('author_id')).values('name')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('relationship_app', '0002_alter_book_options_userprofile'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='book',
+            name='author_name',
+            field=models.CharField(db_index=True, default='', editable=False, max_length=100),
+            preserve_default=False,
+        ),
+        migrations.RunPython(fill_author_name, migrations.RunPython.noop),
+    ]
@@ -4,7 +4,7 @@ from bookshelf.models import CustomUser
 
 # Author Model - represents book authors
 class Author(models.Model):
-    name = models.CharField(max_length=100)
+    name = models.CharField(max_length=100, db_index=True)
     
     def __str__(self):
         return self.name
@@ -15,14 +15,64 @@ class Author(models.Model):
 
 # Book Model - uses ForeignKey to Author (One Author can have many Books)
 class Book(models.Model):
-    title = models.CharField(max_length=200)
-    author = models.ForeignKey(Author, on_delete=models.CASCADE, related_name='books')
+    title = models.CharField(max_length=200, db_index=True)
+    # db_index=False: book_author_title_idx leads with author, so it already
+    # serves lookups by author alone and a separate FK index would duplicate it.
+    author = models.ForeignKey(
+        Author, on_delete=models.CASCADE, related_name='books', db_index=False
+    )
+    # Copy of author.name so listings can show the author without joining
+    # the Author table. Set on save() and kept in step by a signal when the
+    # author is renamed. Writes that skip save() and the Author signal leave
+    # it stale and must set it themselves: Book.objects.bulk_create(),
+    # QuerySet.update(author=...), and Author.objects.update(name=...).
+    author_name = models.CharField(max_length=100, db_index=True, editable=False)
     
     def __str__(self):
         return self.title
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the author the row was loaded with, so save() can tell
+        # whether author_name needs refreshing.
+        instance._loaded_author_id = instance.__dict__.get('author_id')
+        return instance
+    
+    def _author_changed(self):
+        """
+        True if author_id was set on a new book or changed since this book
+        was loaded. A deferred author_id can't have changed.
+        """
+        if 'author_id' not in self.__dict__:
+            return False
+        return self._state.adding or self.author_id != getattr(self, '_loaded_author_id', None)
+    
+    def save(self, *args, **kwargs):
+        """
+        Copy the author's name into author_name. The name comes from an
+        author already loaded onto the book when there is one; otherwise
+        the author is only fetched if author_id changed, so saves that
+        don't touch the author cost no extra query.
+        """
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or {'author', 'author_id'} & set(update_fields):
+            if self.author_id is not None and (
+                Book.author.is_cached(self) or self._author_changed()
+            ):
+                self.author_name = self.author.name
+                if update_fields is not None:
+                    kwargs['update_fields'] = {*update_fields, 'author_name'}
+        super().save(*args, **kwargs)
+        self._loaded_author_id = self.__dict__.get('author_id')
+    
     class Meta:
         app_label = 'relationship_app'
+        indexes = [
+            # Serves "books by this author in this library" lookups and
+            # per-author title ordering.
+            models.Index(fields=['author', 'title'], name='book_author_title_idx'),
+        ]
         permissions = [
             ('can_add_book', 'Can add a new book'),
             ('can_change_book', 'Can edit/change book details'),
@@ -32,7 +82,7 @@ class Book(models.Model):
 
 # Library Model - uses ManyToMany to Book (One Library can have many Books, and one Book can be in many Libraries)
 class Library(models.Model):
-    name = models.CharField(max_length=200)
+    name = models.CharField(max_length=200, db_index=True)
     books = models.ManyToManyField(Book, related_name='libraries')
     
     def __str__(self):
@@ -44,7 +94,7 @@ class Library(models.Model):
 
 # Librarian Model - uses OneToOne to Library (One Librarian manages one Library, and one Library has one Librarian)
 class Librarian(models.Model):
-    name = models.CharField(max_length=100)
+    name = models.CharField(max_length=100, db_index=True)
     library = models.OneToOneField(Library, on_delete=models.CASCADE, related_name='librarian')
     
     def __str__(self):
@@ -62,23 +112,22 @@ class UserProfile(models.Model):
     """
     
     # Role choices for different user types
-    ROLE_CHOICES = [
-        ('admin', 'Admin'),
-        ('librarian', 'Librarian'),
-        ('member', 'Member'),
-    ]
+    class Role(models.TextChoices):
+        ADMIN = 'admin', 'Admin'
+        LIBRARIAN = 'librarian', 'Librarian'
+        MEMBER = 'member', 'Member'
     
     # OneToOne relationship with the CustomUser model
     user = models.OneToOneField(CustomUser, on_delete=models.CASCADE, related_name='userprofile')
     
-    # Role field with predefined choices
-    role = models.CharField(max_length=20, choices=ROLE_CHOICES, default='member')
+    # Role field with predefined choices, indexed for role-filtered lookups
+    role = models.CharField(max_length=20, choices=Role.choices, default=Role.MEMBER, db_index=True)
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     def __str__(self):
-        return f"{self.user.username} - {self.get_role_display()}"
+        return f"{self.user.username} - {self.Role(self.role).label}"
     
     class Meta:
         app_label = 'relationship_app'
@@ -7,6 +7,9 @@ To run these queries, use Django shell:
     exec(open('relationship_app/query_samples.py').read())
 """
 
+from django.db import transaction
+from django.db.models import Count
+
 from relationship_app.models import Author, Book, Library, Librarian
 
 # ============================================================================
@@ -17,17 +20,20 @@ def query_books_by_author(author_name):
     """
     Query all books by a specific author using ForeignKey relationship.
     Author has a one-to-many relationship with Book.
+    The printout only needs titles, so it reads them as plain strings with
+    values_list() instead of building Book instances.
     """
     try:
         # Method 1: Filter books by author name
         author = Author.objects.get(name=author_name)
         books = Book.objects.filter(author=author)
+        titles = list(books.values_list('title', flat=True))
         
         print(f"\n=== Books by Author: {author_name} ===")
         print(f"Author: {author.name}")
-        print(f"Number of books: {books.count()}")
-        for book in books:
-            print(f"  - {book.title} (Author: {book.author.name})")
+        print(f"Number of books: {len(titles)}")
+        for title in titles:
+            print(f"  - {title} (Author: {author.name})")
         
         return books
     except Author.DoesNotExist:
@@ -62,21 +68,25 @@ def query_books_in_library(library_name):
     """
     Query all books in a specific library using ManyToMany relationship.
     Library has a many-to-many relationship with Book.
+    Filters books across the relation and reads (title, author name) pairs
+    from the denormalized author_name column, so the listing is one query
+    and no model instances are built; the library itself is only looked up
+    when no books match, to tell an empty library from a missing one.
     """
-    try:
-        library = Library.objects.get(name=library_name)
-        books = library.books.all()
-        
-        print(f"\n=== Books in Library: {library_name} ===")
-        print(f"Library: {library.name}")
-        print(f"Total books in library: {books.count()}")
-        for book in books:
-            print(f"  - {book.title} (Author: {book.author.name})")
-        
-        return books
-    except Library.DoesNotExist:
+    books = Book.objects.filter(libraries__name=library_name)
+    rows = list(books.values_list('title', 'author_name'))
+    
+    if not rows and not Library.objects.filter(name=library_name).exists():
         print(f"Library '{library_name}' not found.")
         return None
+    
+    print(f"\n=== Books in Library: {library_name} ===")
+    print(f"Library: {library_name}")
+    print(f"Total books in library: {len(rows)}")
+    for title, author_name in rows:
+        print(f"  - {title} (Author: {author_name})")
+    
+    return books
 
 
 def query_libraries_by_book(book_title):
@@ -85,11 +95,11 @@ def query_libraries_by_book(book_title):
     """
     try:
         book = Book.objects.get(title=book_title)
-        libraries = book.libraries.all()
+        libraries = Library.objects.filter(books=book)
         
         print(f"\n=== Libraries containing book: {book_title} ===")
-        print(f"Book: {book.title} (Author: {book.author.name})")
-        print(f"Available in {libraries.count()} libraries:")
+        print(f"Book: {book.title} (Author: {book.author_name})")
+        print(f"Available in {len(libraries)} libraries:")
         for library in libraries:
             print(f"  - {library.name}")
         
@@ -175,13 +185,15 @@ def query_all_books_by_author_in_library(author_name, library_name):
         author = Author.objects.get(name=author_name)
         library = Library.objects.get(name=library_name)
         
-        # Books by author that are also in this library
-        books = library.books.filter(author=author)
+        # Books by author that are also in this library. Filtering from the
+        # Book side lets the (author, title) index narrow the rows before
+        # the through-table join, and only the printed column is loaded.
+        books = Book.objects.filter(author=author, libraries=library).only('id', 'title')
         
         print(f"\n=== Books by {author_name} in {library_name} ===")
         print(f"Author: {author.name}")
         print(f"Library: {library.name}")
-        print(f"Matching books: {books.count()}")
+        print(f"Matching books: {len(books)}")
         for book in books:
             print(f"  - {book.title}")
         
@@ -194,64 +206,109 @@ def query_all_books_by_author_in_library(author_name, library_name):
 def query_all_library_data():
     """
     Comprehensive query showing all entities and their relationships.
+    Counts are annotated and related names joined, so each section is a
+    single query regardless of how many rows it prints. Rows are streamed
+    as plain tuples in chunks, so no model instances are built and memory
+    stays flat on large tables.
     """
     print("\n=== All Library Data ===")
     
     print("\nAuthors:")
-    for author in Author.objects.all():
-        print(f"  - {author.name} ({author.books.count()} books)")
+    authors = Author.objects.annotate(books_count=Count('books')).values_list('name', 'books_count')
+    for name, books_count in authors.iterator(chunk_size=2000):
+        print(f"  - {name} ({books_count} books)")
     
     print("\nBooks:")
-    for book in Book.objects.all():
-        libraries_count = book.libraries.count()
-        print(f"  - {book.title} by {book.author.name} ({libraries_count} libraries)")
+    books = Book.objects.annotate(libraries_count=Count('libraries')).values_list(
+        'title', 'author_name', 'libraries_count'
+    )
+    for title, author_name, libraries_count in books.iterator(chunk_size=2000):
+        print(f"  - {title} by {author_name} ({libraries_count} libraries)")
     
     print("\nLibraries:")
-    for library in Library.objects.all():
-        books_count = library.books.count()
-        librarian = getattr(library, 'librarian', None)
-        librarian_name = librarian.name if librarian else "Not assigned"
-        print(f"  - {library.name} ({books_count} books, Librarian: {librarian_name})")
+    libraries = Library.objects.annotate(books_count=Count('books')).values_list(
+        'name', 'books_count', 'librarian__name'
+    )
+    for name, books_count, librarian_name in libraries.iterator(chunk_size=2000):
+        librarian_name = librarian_name or "Not assigned"
+        print(f"  - {name} ({books_count} books, Librarian: {librarian_name})")
 
 
 # ============================================================================
 # Sample Usage and Data Creation
 # ============================================================================
 
+def _bulk_get_or_create(model, objs, *key_fields):
+    """
+    Batched get_or_create: look up the rows matching objs by key_fields in
+    one query, insert the missing ones with a single bulk_create(), and
+    return the saved instances in the same order as objs. Like
+    get_or_create() it never duplicates rows on a rerun, which
+    bulk_create(ignore_conflicts=True) can't promise here because none of
+    the sample models has a unique constraint on these fields.
+    """
+    def key(obj):
+        return tuple(getattr(obj, field) for field in key_fields)
+
+    first = key_fields[0]
+    existing = {
+        key(obj): obj
+        for obj in model.objects.filter(**{f"{first}__in": [getattr(o, first) for o in objs]})
+    }
+    missing = [obj for obj in objs if key(obj) not in existing]
+    model.objects.bulk_create(missing)
+    existing.update((key(obj), obj) for obj in missing)
+    return [existing[key(obj)] for obj in objs]
+
+
 def create_sample_data():
     """
     Create sample data for demonstration purposes.
     Run this function first to populate the database.
+    Each model's rows are looked up and inserted in batches inside one
+    transaction, so rerunning it is safe and costs a handful of queries.
     """
     print("\n=== Creating Sample Data ===")
     
-    # Create Authors
-    author1, created = Author.objects.get_or_create(name="J.K. Rowling")
-    author2, created = Author.objects.get_or_create(name="George R.R. Martin")
-    author3, created = Author.objects.get_or_create(name="J.R.R. Tolkien")
-    print("✓ Authors created")
-    
-    # Create Books
-    book1, created = Book.objects.get_or_create(title="Harry Potter and the Philosopher's Stone", author=author1)
-    book2, created = Book.objects.get_or_create(title="Harry Potter and the Chamber of Secrets", author=author1)
-    book3, created = Book.objects.get_or_create(title="A Game of Thrones", author=author2)
-    book4, created = Book.objects.get_or_create(title="The Fellowship of the Ring", author=author3)
-    print("✓ Books created")
-    
-    # Create Libraries
-    lib1, created = Library.objects.get_or_create(name="Central Library")
-    lib2, created = Library.objects.get_or_create(name="Downtown Library")
-    print("✓ Libraries created")
-    
-    # Add books to libraries (ManyToMany)
-    lib1.books.add(book1, book2, book3, book4)
-    lib2.books.add(book1, book3)
-    print("✓ Books added to libraries")
-    
-    # Create Librarians (OneToOne)
-    librarian1, created = Librarian.objects.get_or_create(name="Alice Johnson", library=lib1)
-    librarian2, created = Librarian.objects.get_or_create(name="Bob Smith", library=lib2)
-    print("✓ Librarians created")
+    with transaction.atomic():
+        # Create Authors
+        author1, author2, author3 = _bulk_get_or_create(Author, [
+            Author(name="J.K. Rowling"),
+            Author(name="George R.R. Martin"),
+            Author(name="J.R.R. Tolkien"),
+        ], 'name')
+        print("✓ Authors created")
+        
+        # Create Books (bulk_create skips Book.save(), so author_name is set here)
+        book1, book2, book3, book4 = _bulk_get_or_create(Book, [
+            Book(title=title, author=author, author_name=author.name)
+            for title, author in [
+                ("Harry Potter and the Philosopher's Stone", author1),
+                ("Harry Potter and the Chamber of Secrets", author1),
+                ("A Game of Thrones", author2),
+                ("The Fellowship of the Ring", author3),
+            ]
+        ], 'title', 'author_id')
+        print("✓ Books created")
+        
+        # Create Libraries
+        lib1, lib2 = _bulk_get_or_create(Library, [
+            Library(name="Central Library"),
+            Library(name="Downtown Library"),
+        ], 'name')
+        print("✓ Libraries created")
+        
+        # Add books to libraries (ManyToMany)
+        lib1.books.add(book1, book2, book3, book4)
+        lib2.books.add(book1, book3)
+        print("✓ Books added to libraries")
+        
+        # Create Librarians (OneToOne)
+        _bulk_get_or_create(Librarian, [
+            Librarian(name="Alice Johnson", library=lib1),
+            Librarian(name="Bob Smith", library=lib2),
+        ], 'library_id', 'name')
+        print("✓ Librarians created")
     
     print("\n✓ Sample data created successfully!")
 
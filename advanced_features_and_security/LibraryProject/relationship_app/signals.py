@@ -5,27 +5,53 @@ This module defines signal handlers for automatic model operations,
 such as creating a UserProfile when a new User is created.
 """
 
-from django.db.models.signals import post_save
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from django.contrib.auth.models import User
-from .models import UserProfile
+from .caching import invalidate_catalogue
+from .models import Author, Book, UserProfile
 
 
-@receiver(post_save, sender=User)
-def create_userprofile(sender, instance, created, **kwargs):
+# The sender is given as the lazy "app_label.ModelName" string so importing
+# this module from AppConfig.ready() stays cheap, and so the handlers follow
+# AUTH_USER_MODEL instead of always listening to django.contrib.auth's User.
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def sync_userprofile(sender, instance, created, update_fields=None, **kwargs):
     """
-    Signal handler to automatically create a UserProfile when a new User is created.
-    This ensures every user has an associated profile with a default role of 'member'.
+    Signal handler that keeps a user's UserProfile in step with the user.
+    New users get a profile with the default 'member' role. On later full
+    saves the profile is saved too, but only if it was already loaded onto
+    the user (and so may have been edited); otherwise nothing is queried.
+    Partial saves such as the last_login update on login are skipped.
     """
     if created:
-        UserProfile.objects.create(user=instance, role='member')
+        UserProfile.objects.create(user=instance, role=UserProfile.Role.MEMBER)
+    elif update_fields is None and sender.userprofile.is_cached(instance):
+        profile = getattr(instance, 'userprofile', None)
+        if profile is not None:
+            profile.save()
 
 
-@receiver(post_save, sender=User)
-def save_userprofile(sender, instance, **kwargs):
+@receiver(post_save, sender=Author)
+def sync_book_author_name(sender, instance, created, **kwargs):
     """
-    Signal handler to save UserProfile whenever User is saved.
-    This ensures the UserProfile is updated if the user object changes.
+    Signal handler to copy an author's name onto their books' denormalized
+    author_name column whenever the author is saved.
     """
-    if hasattr(instance, 'userprofile'):
-        instance.userprofile.save()
+    if not created:
+        Book.objects.filter(author=instance).exclude(
+            author_name=instance.name
+        ).update(author_name=instance.name)
+
+
+@receiver(post_save, sender=Book)
+@receiver(post_delete, sender=Book)
+@receiver(post_save, sender=Author)
+@receiver(post_delete, sender=Author)
+def invalidate_cached_catalogue(sender, **kwargs):
+    """
+    Signal handler to move the catalogue version on whenever a book or
+    author changes, so cached list_books pages are rebuilt on their next
+    request. Other entries in the 'pages' cache are left alone.
+    """
+    invalidate_catalogue()
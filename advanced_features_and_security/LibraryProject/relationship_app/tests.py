@@ -1,3 +1,321 @@
-from django.test import TestCase
+import io
+from contextlib import redirect_stdout
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import caches
+from django.db import IntegrityError, transaction
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from . import query_samples, views
+from .backends import UserProfileBackend
+from .models import Author, Book, Library, UserProfile
+
+
+class UserProfileSignalTests(TestCase):
+
+    def test_profile_created_for_new_user(self):
+        user = get_user_model().objects.create_user(
+            email='member@example.com', username='member'
+        )
+        profile = UserProfile.objects.get(user=user)
+        self.assertEqual(profile.role, UserProfile.Role.MEMBER)
+        self.assertEqual(str(profile), 'member - Member')
+
+    def test_saving_user_does_not_touch_unloaded_profile(self):
+        user = get_user_model().objects.create_user(
+            email='member@example.com', username='member'
+        )
+        user = get_user_model().objects.get(pk=user.pk)
+        user.first_name = 'Changed'
+        with self.assertNumQueries(1):
+            user.save()
+
+    def test_saving_user_saves_loaded_profile(self):
+        user = get_user_model().objects.create_user(
+            email='member@example.com', username='member'
+        )
+        user.userprofile.role = 'librarian'
+        user.save()
+        self.assertEqual(UserProfile.objects.get(user=user).role, 'librarian')
+
+
+class RolePredicateTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            email='librarian@example.com', username='librarian'
+        )
+        UserProfile.objects.filter(user=cls.user).update(role=UserProfile.Role.LIBRARIAN)
+
+    def setUp(self):
+        caches['pages'].clear()
+
+    def test_role_is_read_once_per_user_instance(self):
+        user = get_user_model().objects.get(pk=self.user.pk)
+        with self.assertNumQueries(1):
+            self.assertFalse(views.is_admin(user))
+            self.assertTrue(views.is_librarian(user))
+            self.assertFalse(views.is_member(user))
+
+    def test_backend_loads_profile_with_user(self):
+        with self.assertNumQueries(1):
+            user = UserProfileBackend().get_user(self.user.pk)
+            self.assertTrue(views.is_librarian(user))
+
+    @override_settings(SECURE_SSL_REDIRECT=False)
+    def test_dashboard_renders_shared_context(self):
+        self.client.force_login(self.user)
+        before = dict(views._LIBRARIAN_CONTEXT)
+        response = self.client.get(reverse('relationship_app:librarian_view'))
+        self.assertContains(response, 'Welcome to the Librarian Dashboard')
+        self.assertEqual(views._LIBRARIAN_CONTEXT, before)
+        response = self.client.get(reverse('relationship_app:admin_view'))
+        self.assertEqual(response.status_code, 302)
+
+    @override_settings(SECURE_SSL_REDIRECT=False)
+    def test_cached_dashboard_still_checks_role(self):
+        self.client.force_login(self.user)
+        self.client.get(reverse('relationship_app:librarian_view'))
+        response = self.client.get(reverse('relationship_app:librarian_view'))
+        self.assertContains(response, 'Welcome to the Librarian Dashboard')
+        self.assertTemplateNotUsed(response, 'relationship_app/librarian_view.html')
+
+        member = get_user_model().objects.create_user(
+            email='member@example.com', username='member'
+        )
+        self.client.force_login(member)
+        response = self.client.get(reverse('relationship_app:librarian_view'))
+        self.assertEqual(response.status_code, 302)
+
+    @override_settings(SECURE_SSL_REDIRECT=False)
+    def test_dashboard_is_not_cached_downstream(self):
+        self.client.force_login(self.user)
+        for _ in range(2):
+            response = self.client.get(reverse('relationship_app:librarian_view'))
+            cache_control = response['Cache-Control']
+            self.assertIn('private', cache_control)
+            self.assertIn('no-store', cache_control)
+            self.assertIn('max-age=0', cache_control)
+
+    @override_settings(SECURE_SSL_REDIRECT=False)
+    def test_book_change_keeps_cached_dashboard(self):
+        self.client.force_login(self.user)
+        self.client.get(reverse('relationship_app:librarian_view'))
+        Author.objects.create(name='New Author')
+        response = self.client.get(reverse('relationship_app:librarian_view'))
+        self.assertTemplateNotUsed(response, 'relationship_app/librarian_view.html')
+
+    def test_user_logout_redirects_to_login(self):
+        request = RequestFactory().get('/')
+        request.user = self.user
+        request.session = self.client.session
+        response = views.user_logout(request)
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.url, reverse('relationship_app:login'))
+
+    def test_user_without_profile_has_no_role(self):
+        UserProfile.objects.filter(user=self.user).delete()
+        user = get_user_model().objects.get(pk=self.user.pk)
+        self.assertFalse(views.is_admin(user))
+        # Forget Django's own cache of the missing profile, so only the
+        # role memo can keep the next checks off the database.
+        user._state.fields_cache.clear()
+        with self.assertNumQueries(0):
+            self.assertFalse(views.is_librarian(user))
+            self.assertFalse(views.is_member(user))
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class LoginViewTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            email='reader@example.com', username='reader', password='s3cret-pass'
+        )
+
+    def test_login_redirects_to_book_list(self):
+        response = self.client.post(
+            reverse('relationship_app:login'),
+            {'username': 'reader', 'password': 's3cret-pass'},
+        )
+        self.assertRedirects(response, reverse('relationship_app:list_books'))
+
+    def test_user_login_authenticates_once(self):
+        request = RequestFactory().post(
+            '/', {'username': 'reader', 'password': 's3cret-pass'}
+        )
+        request.session = self.client.session
+        with mock.patch.object(
+            UserProfileBackend, 'authenticate', autospec=True,
+            side_effect=ModelBackend.authenticate,
+        ) as authenticate:
+            response = views.user_login(request)
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(authenticate.call_count, 1)
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class BookViewQueryTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        authors = Author.objects.bulk_create(
+            Author(name=f'Author {i}') for i in range(3)
+        )
+        cls.books = Book.objects.bulk_create(
+            Book(title=f'Book {i}', author=author, author_name=author.name)
+            for i, author in enumerate(authors)
+        )
+        cls.library = Library.objects.create(name='Central')
+        cls.library.books.set(cls.books)
+
+    def setUp(self):
+        # Rendered pages outlive each test's rollback, so start uncached.
+        caches['pages'].clear()
+
+    def test_list_books_reads_only_the_book_table(self):
+        # The page count and the page rows; no author queries.
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('relationship_app:list_books'))
+        self.assertContains(response, 'by Author 2')
+        self.assertContains(response, 'Total Books: 3')
+        self.assertEqual(
+            response.context['books'][0], {'title': 'Book 0', 'author_name': 'Author 0'}
+        )
+
+    def test_list_books_is_paginated(self):
+        author = self.books[0].author
+        Book.objects.bulk_create(
+            Book(title=f'Extra {i}', author=author, author_name=author.name)
+            for i in range(views.BOOKS_PER_PAGE)
+        )
+        response = self.client.get(reverse('relationship_app:list_books'), {'page': 2})
+        self.assertEqual(len(response.context['books']), 3)
+        self.assertContains(response, 'Page 2 of 2')
+
+    def test_list_books_is_served_from_cache(self):
+        self.client.get(reverse('relationship_app:list_books'))
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('relationship_app:list_books'))
+        self.assertContains(response, 'by Author 2')
+
+    def test_book_change_invalidates_cached_list(self):
+        self.client.get(reverse('relationship_app:list_books'))
+        Book.objects.create(title='Fresh Book', author=self.books[0].author)
+        response = self.client.get(reverse('relationship_app:list_books'))
+        self.assertContains(response, 'Fresh Book')
+
+    def test_book_change_keeps_other_cached_pages(self):
+        caches['pages'].set('unrelated', 'kept')
+        Book.objects.create(title='Fresh Book', author=self.books[0].author)
+        self.assertEqual(caches['pages'].get('unrelated'), 'kept')
+
+    def test_shared_pages_render_without_request_context(self):
+        response = self.client.get(reverse('relationship_app:list_books'))
+        self.assertIsNone(response.context.get('user'))
+        self.assertIsNone(response.context.get('csrf_token'))
+
+    def test_list_books_is_not_cached_downstream(self):
+        response = self.client.get(reverse('relationship_app:list_books'))
+        self.assertEqual(response['Cache-Control'], 'max-age=0')
+
+    def test_list_books_renders_uncached_for_odd_page_values(self):
+        response = self.client.get(reverse('relationship_app:list_books'), {'page': 'x' * 300})
+        self.assertContains(response, 'by Author 0')
+
+    def test_renaming_author_updates_book_author_name(self):
+        author = self.books[0].author
+        author.name = 'Renamed'
+        author.save()
+        self.assertEqual(Book.objects.get(pk=self.books[0].pk).author_name, 'Renamed')
+
+    def test_saving_book_copies_author_name(self):
+        book = Book.objects.create(title='New', author=self.books[1].author)
+        self.assertEqual(book.author_name, 'Author 1')
+
+    def test_saving_book_without_author_is_rejected_by_database(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Book.objects.create(title='Orphan')
+
+    def test_saving_book_without_author_change_skips_author_lookup(self):
+        book = Book.objects.get(pk=self.books[0].pk)
+        book.title = 'Retitled'
+        with self.assertNumQueries(1):
+            book.save()
+
+    def test_changing_author_id_refreshes_author_name(self):
+        book = Book.objects.get(pk=self.books[0].pk)
+        book.author_id = self.books[2].author_id
+        book.save()
+        self.assertEqual(Book.objects.get(pk=book.pk).author_name, 'Author 2')
+
+    def test_update_fields_with_author_saves_author_name(self):
+        book = Book.objects.get(pk=self.books[0].pk)
+        book.author = self.books[1].author
+        book.save(update_fields=['author'])
+        self.assertEqual(Book.objects.get(pk=book.pk).author_name, 'Author 1')
+
+    def test_library_detail_counts_books(self):
+        response = self.client.get(
+            reverse('relationship_app:library_detail', args=[self.library.pk])
+        )
+        self.assertEqual(response.context['books_count'], 3)
+
+    def test_library_detail_prefetches_books_and_authors(self):
+        # The library, then its prefetched books.
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse('relationship_app:library_detail', args=[self.library.pk])
+            )
+        self.assertContains(response, 'by Author 2')
+
+
+class QuerySamplesTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        with redirect_stdout(io.StringIO()):
+            query_samples.create_sample_data()
+
+    def test_all_library_data_takes_one_query_per_section(self):
+        out = io.StringIO()
+        with self.assertNumQueries(3), redirect_stdout(out):
+            query_samples.query_all_library_data()
+        self.assertIn('Central Library (4 books, Librarian: Alice Johnson)', out.getvalue())
+
+    def test_books_in_library_is_one_query(self):
+        out = io.StringIO()
+        with self.assertNumQueries(1), redirect_stdout(out):
+            books = query_samples.query_books_in_library('Downtown Library')
+        self.assertEqual(len(books), 2)
+        self.assertIn('A Game of Thrones (Author: George R.R. Martin)', out.getvalue())
+
+    def test_books_in_missing_library(self):
+        with redirect_stdout(io.StringIO()):
+            self.assertIsNone(query_samples.query_books_in_library('Nowhere'))
+
+    def test_libraries_by_book(self):
+        out = io.StringIO()
+        with self.assertNumQueries(2), redirect_stdout(out):
+            query_samples.query_libraries_by_book('A Game of Thrones')
+        self.assertIn('Available in 2 libraries:', out.getvalue())
+
+    def test_books_by_author_in_library(self):
+        out = io.StringIO()
+        # Author, library, then the matching books.
+        with self.assertNumQueries(3), redirect_stdout(out):
+            query_samples.query_all_books_by_author_in_library('J.K. Rowling', 'Downtown Library')
+        self.assertIn('Matching books: 1', out.getvalue())
+
+    def test_create_sample_data_is_idempotent(self):
+        with redirect_stdout(io.StringIO()):
+            query_samples.create_sample_data()
+        self.assertEqual(Author.objects.count(), 3)
+        self.assertEqual(Book.objects.count(), 4)
+        self.assertEqual(Library.objects.count(), 2)
+        self.assertEqual(Book.objects.get(title='A Game of Thrones').author_name, 'George R.R. Martin')
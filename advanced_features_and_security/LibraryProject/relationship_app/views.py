@@ -1,6 +1,5 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.views.generic.detail import DetailView
-from django.contrib.auth import authenticate
 from django.contrib.auth import login
 from django.contrib.auth import logout
 from django.contrib.auth.views import LoginView, LogoutView
@@ -10,22 +9,64 @@ from django.contrib.auth.decorators import permission_required
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
 from django.forms import ModelForm
 from django import forms
+from django.db.models import Prefetch
+from django.core.paginator import Paginator
+from django.views.decorators.cache import cache_control, never_cache
 from .models import Book
 from .models import Library
 from .models import Author
+from .caching import catalogue_version, render_cached
+
+
+BOOKS_PER_PAGE = 50
+LIST_BOOKS_CACHE_SECONDS = 60 * 5
+DASHBOARD_CACHE_SECONDS = 60 * 10
+
+
+def _list_books_cache_key(request):
+    """
+    Return the cache key for the requested list_books page, or None when
+    ?page= is not a short page number. Those requests are rendered
+    uncached, so arbitrary query strings can't fill the cache.
+    """
+    page_number = request.GET.get('page', '1')
+    if page_number.isdecimal() and len(page_number) <= 6:
+        return f'list_books:{int(page_number)}'
+    return None
 
 
 # Function-based View: List all books
+@cache_control(max_age=0)
 def list_books(request):
     """
     Function-based view that displays all books in the database.
     This view retrieves all books and renders them in a template.
-    """
-    books = Book.objects.all()
-    context = {
-        'books': books
-    }
-    return render(request, 'relationship_app/list_books.html', context)
+    Author names come from the denormalized Book.author_name column, so
+    no other table is queried, and rows come back as plain dicts because
+    the template only reads those two values.
+    Books are paginated BOOKS_PER_PAGE at a time, so each request loads
+    one LIMIT/OFFSET slice plus a COUNT instead of the whole table.
+    The rendered page is cached server-side for five minutes under the
+    catalogue version, which moves on whenever a book or author changes
+    (see signals.py). The response itself carries max-age=0, so browsers
+    and proxies revalidate instead of keeping an old list.
+    """
+    def get_context():
+        books = Book.objects.values('title', 'author_name').order_by('id')
+        page = Paginator(books, BOOKS_PER_PAGE).get_page(request.GET.get('page'))
+        return {
+            'page': page,
+            'books': page.object_list,
+        }
+
+    template_name = 'relationship_app/list_books.html'
+    key = _list_books_cache_key(request)
+    if key is None:
+        return render(request, template_name, get_context())
+    return render_cached(
+        key, template_name, get_context,
+        LIST_BOOKS_CACHE_SECONDS, version=catalogue_version(),
+    )
 
 
 # Class-based View: Display specific library details
@@ -39,6 +80,16 @@ class LibraryDetailView(DetailView):
     template_name = 'relationship_app/library_detail.html'
     context_object_name = 'library'
     
+    def get_queryset(self):
+        """
+        Prefetch the library's books so the count and the template's book
+        list both come from one extra query; author names come from
+        Book.author_name.
+        """
+        return Library.objects.prefetch_related(
+            Prefetch('books', queryset=Book.objects.only('id', 'title', 'author_name'))
+        )
+    
     def get_context_data(self, **kwargs):
         """
         Add additional context data for the template.
@@ -46,7 +97,8 @@ class LibraryDetailView(DetailView):
         context = super().get_context_data(**kwargs)
         # The library object is already available as 'library' due to context_object_name
         # You can add more context data here if needed
-        context['books_count'] = self.object.books.count()
+        # Counted from the prefetched books, so no COUNT query is needed
+        context['books_count'] = len(self.object.books.all())
         return context
 
 
@@ -79,12 +131,10 @@ def user_login(request):
     if request.method == 'POST':
         form = AuthenticationForm(request, data=request.POST)
         if form.is_valid():
-            username = form.cleaned_data.get('username')
-            password = form.cleaned_data.get('password')
-            user = authenticate(username=username, password=password)
-            if user is not None:
-                login(request, user)
-                return redirect('relationship_app:list_books')
+            # The form authenticated the user while validating, so reuse
+            # that user instead of hashing the password a second time.
+            login(request, form.get_user())
+            return redirect('relationship_app:list_books')
     else:
         form = AuthenticationForm()
     
@@ -95,10 +145,11 @@ def user_login(request):
 def user_logout(request):
     """
     Function-based view for user logout.
-    Terminates the user session and redirects to logout confirmation page.
+    Terminates the user session and redirects to the login page, so
+    there is no confirmation template to render.
     """
     logout(request)
-    return render(request, 'relationship_app/logout.html')
+    return redirect('relationship_app:login')
 
 
 # Class-based Authentication Views
@@ -110,14 +161,8 @@ class UserLoginView(LoginView):
     """
     template_name = 'relationship_app/login.html'
     form_class = AuthenticationForm
-    success_url = 'relationship_app:list_books'
-    
-    def get_success_url(self):
-        """
-        Redirect to the list_books page after successful login.
-        """
-        from django.urls import reverse
-        return reverse('relationship_app:list_books')
+    # LoginView resolves the URL name itself when no ?next= is given
+    next_page = 'relationship_app:list_books'
 
 
 class UserLogoutView(LogoutView):
@@ -130,67 +175,110 @@ class UserLogoutView(LogoutView):
 
 # Role-Based Access Control Views
 
+# Marks a role that hasn't been looked up yet; None is a real result.
+_UNSET = object()
+
+
+def _get_role(user):
+    """
+    Return the user's profile role, or None if they have no profile.
+    The result is stored on the user instance, and request.user is built
+    fresh for every request, so repeated role checks within one request
+    read the profile at most once.
+    """
+    role = getattr(user, '_cached_role', _UNSET)
+    if role is _UNSET:
+        role = getattr(getattr(user, 'userprofile', None), 'role', None)
+        user._cached_role = role
+    return role
+
+
 def is_admin(user):
     """
     Check if the user has the 'admin' role.
     """
-    return user.is_authenticated and hasattr(user, 'userprofile') and user.userprofile.role == 'admin'
+    return user.is_authenticated and _get_role(user) == 'admin'
 
 
 def is_librarian(user):
     """
     Check if the user has the 'librarian' role.
     """
-    return user.is_authenticated and hasattr(user, 'userprofile') and user.userprofile.role == 'librarian'
+    return user.is_authenticated and _get_role(user) == 'librarian'
 
 
 def is_member(user):
     """
     Check if the user has the 'member' role.
     """
-    return user.is_authenticated and hasattr(user, 'userprofile') and user.userprofile.role == 'member'
-
-
+    return user.is_authenticated and _get_role(user) == 'member'
+
+
+# The dashboards' context never changes, so each view renders a shared
+# module-level dict instead of building a new one per request. Rendering
+# layers it into a fresh Context and never writes to it.
+# The rendered dashboards are the same for every user with the role, so
+# their bodies are cached server-side for ten minutes under one key per
+# role. render_cached renders them without the request, so the templates
+# must not use anything beyond these dicts. The role check runs before a
+# cached body is served, and never_cache keeps browsers and proxies from
+# storing a role-gated page.
+_ADMIN_CONTEXT = {
+    'role': 'Admin',
+    'message': 'Welcome to the Admin Dashboard',
+    'description': 'You have administrative access to manage the library system.',
+}
+
+_LIBRARIAN_CONTEXT = {
+    'role': 'Librarian',
+    'message': 'Welcome to the Librarian Dashboard',
+    'description': 'You have access to manage library resources and patron information.',
+}
+
+_MEMBER_CONTEXT = {
+    'role': 'Member',
+    'message': 'Welcome to your Member Dashboard',
+    'description': 'You have access to browse library resources and manage your profile.',
+}
+
+
+@never_cache
 @user_passes_test(is_admin)
 def admin_view(request):
     """
     View accessible only to users with 'Admin' role.
     Displays administrative content and controls.
     """
-    context = {
-        'role': 'Admin',
-        'message': 'Welcome to the Admin Dashboard',
-        'description': 'You have administrative access to manage the library system.',
-    }
-    return render(request, 'relationship_app/admin_view.html', context)
+    return render_cached(
+        'dashboard:admin', 'relationship_app/admin_view.html',
+        lambda: _ADMIN_CONTEXT, DASHBOARD_CACHE_SECONDS,
+    )
 
 
+@never_cache
 @user_passes_test(is_librarian)
 def librarian_view(request):
     """
     View accessible only to users with 'Librarian' role.
     Displays librarian-specific content and controls.
     """
-    context = {
-        'role': 'Librarian',
-        'message': 'Welcome to the Librarian Dashboard',
-        'description': 'You have access to manage library resources and patron information.',
-    }
-    return render(request, 'relationship_app/librarian_view.html', context)
+    return render_cached(
+        'dashboard:librarian', 'relationship_app/librarian_view.html',
+        lambda: _LIBRARIAN_CONTEXT, DASHBOARD_CACHE_SECONDS,
+    )
 
 
+@never_cache
 @user_passes_test(is_member)
 def member_view(request):
     """
     View accessible only to users with 'Member' role.
     Displays member-specific content and controls.
     """
-    context = {
-        'role': 'Member',
-        'message': 'Welcome to your Member Dashboard',
-        'description': 'You have access to browse library resources and manage your profile.',
-    }
-    return render(request, 'relationship_app/member_view.html', context)
+    return render_cached(
+        'dashboard:member', 'relationship_app/member_view.html',
+        lambda: _MEMBER_CONTEXT, DASHBOARD_CACHE_SECONDS,
+    )
 
 
 # Form for Book operations
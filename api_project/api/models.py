@@ -5,6 +5,8 @@ class Book(models.Model):
     title = models.CharField(max_length=200)
     author = models.CharField(max_length=200)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Drives the ETags on BookViewSet; not part of the API representation.
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.title} by {self.author}"
@@ -1,13 +1,19 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 from .models import Book
+from .serializers import BookSerializer
 
 
 class BookAPITest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.book1 = Book.objects.create(title='Book A', author='Author 1')
+        cls.book2 = Book.objects.create(title='Book B', author='Author 2')
+
     def setUp(self):
         self.client = APIClient()
-        self.book1 = Book.objects.create(title='Book A', author='Author 1')
-        self.book2 = Book.objects.create(title='Book B', author='Author 2')
 
     def test_list_books(self):
         response = self.client.get('/api/books/')
@@ -20,6 +26,36 @@ class BookAPITest(TestCase):
             self.assertIn('title', item)
             self.assertIn('author', item)
 
+    def test_list_matches_serializer_output(self):
+        expected = BookSerializer(Book.objects.all(), many=True).data
+        for url in ('/api/books/', '/api/books_all/'):
+            response = self.client.get(url)
+            self.assertEqual(response.json(), [dict(item) for item in expected])
+
+    def test_viewset_list_and_detail_support_etags(self):
+        for url in ('/api/books_all/', f'/api/books_all/{self.book1.pk}/'):
+            etag = self.client.get(url)['ETag']
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304)
+
+    def test_etag_changes_after_update(self):
+        url = f'/api/books_all/{self.book1.pk}/'
+        list_etag = self.client.get('/api/books_all/')['ETag']
+        detail_etag = self.client.get(url)['ETag']
+        self.book1.title = 'Book A Revised'
+        self.book1.save()
+        response = self.client.get('/api/books_all/', HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], 'Book A Revised')
+
+    def test_retrieve_skips_unserialized_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f'/api/books_all/{self.book1.pk}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('updated_at', queries[-1]['sql'])
+
     def test_create_book_requires_auth(self):
         # Unauthenticated requests should be denied for create
         data = {'title': 'Book C', 'author': 'Author 3'}
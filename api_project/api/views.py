@@ -1,22 +1,74 @@
+from django.db.models import Count, Max
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import generics, viewsets, permissions
 from rest_framework.authentication import TokenAuthentication, SessionAuthentication
+from rest_framework.response import Response
 from .models import Book
 from .serializers import BookSerializer
 
 
-class BookList(generics.ListAPIView):
+def book_list_etag(request, *args, **kwargs):
+    """ETag for the whole book collection, from one aggregate query.
+
+    Adding or deleting a book changes the count and saving one moves the
+    latest updated_at, so either invalidates the tag.
+    """
+    stats = Book.objects.aggregate(count=Count('id'), latest=Max('updated_at'))
+    latest = stats['latest'].timestamp() if stats['latest'] else 0
+    return f"books-{stats['count']}-{latest}"
+
+
+def book_detail_etag(request, pk=None, *args, **kwargs):
+    """ETag for one book; None (no tag) when it doesn't exist."""
+    updated_at = Book.objects.filter(pk=pk).values_list('updated_at', flat=True).first()
+    if updated_at is None:
+        return None
+    return f"book-{pk}-{updated_at.timestamp()}"
+
+
+class BookValuesListMixin:
+    """Serve list requests straight from .values() rows.
+
+    The dicts carry the same keys BookSerializer emits, so list responses
+    skip model instantiation and per-object serializer work. Every other
+    action still goes through the serializer.
+    """
+    list_fields = ('id', 'title', 'author', 'created_at')
+
+    def list(self, request, *args, **kwargs):
+        rows = self.filter_queryset(self.get_queryset()).values(*self.list_fields)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(list(page))
+        return Response(list(rows))
+
+
+class BookList(BookValuesListMixin, generics.ListAPIView):
     queryset = Book.objects.all()
     serializer_class = BookSerializer
 
 
-class BookViewSet(viewsets.ModelViewSet):
+@method_decorator(condition(etag_func=book_list_etag), name='list')
+@method_decorator(condition(etag_func=book_detail_etag), name='retrieve')
+class BookViewSet(BookValuesListMixin, viewsets.ModelViewSet):
     """Provides CRUD operations for Book.
 
     Authentication: TokenAuthentication (also supports session auth).
     Permissions: Authenticated users can create/update/delete; unauthenticated users can only read (list/retrieve).
+    Caching: list and retrieve send an ETag and answer a matching
+    If-None-Match with 304 Not Modified before any serialization runs.
     """
     queryset = Book.objects.all()
     serializer_class = BookSerializer
     authentication_classes = [TokenAuthentication, SessionAuthentication]
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'retrieve':
+            # Only load what the serializer emits. Writes keep full rows so
+            # save() still bumps updated_at for the ETags.
+            queryset = queryset.only(*self.list_fields)
+        return queryset
+
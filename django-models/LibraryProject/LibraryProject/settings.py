@@ -83,6 +83,24 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+# 'pages' holds relationship_app's rendered pages (see
+# relationship_app/caching.py). LocMemCache is per process: use a shared
+# backend such as Redis when running several workers, or a worker may serve
+# a stale book list until the page timeout.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'pages': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'pages',
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -101,6 +119,27 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# https://docs.djangoproject.com/en/6.0/topics/auth/passwords/
+# scrypt hashes new passwords with less CPU time than PBKDF2's default
+# iteration count. The PBKDF2 hashers verify older passwords, which are
+# rehashed with scrypt at the user's next login.
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
+
+# Authentication backends
+# https://docs.djangoproject.com/en/6.0/ref/settings/#authentication-backends
+# UserProfileBackend is ModelBackend plus select_related('userprofile').
+
+AUTHENTICATION_BACKENDS = [
+    'relationship_app.backends.UserProfileBackend',
+]
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/6.0/topics/i18n/
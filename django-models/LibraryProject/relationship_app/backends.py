@@ -0,0 +1,21 @@
+"""
+Authentication backend for relationship_app
+"""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+
+class UserProfileBackend(ModelBackend):
+    """
+    Restores the session user with their UserProfile joined in, so the
+    role checks in views.py don't query the profile separately.
+    """
+
+    def get_user(self, user_id):
+        UserModel = get_user_model()
+        try:
+            user = UserModel._default_manager.select_related('userprofile').get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
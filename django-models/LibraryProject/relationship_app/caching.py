@@ -0,0 +1,50 @@
+"""
+Page caching helpers for relationship_app
+
+Catalogue pages (those built from books and authors) are cached in the
+'pages' alias under a shared version number. Bumping the version retires
+all of them at once and leaves other entries alone.
+"""
+
+import time
+
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+
+
+PAGE_CACHE_ALIAS = 'pages'
+CATALOGUE_VERSION_KEY = 'catalogue_version'
+
+
+def catalogue_version():
+    """
+    The current catalogue version. If it was evicted, a fresh timestamp is
+    used, never a fixed starting value that old pages may still carry.
+    """
+    return caches[PAGE_CACHE_ALIAS].get_or_set(
+        CATALOGUE_VERSION_KEY, time.time_ns, timeout=None
+    )
+
+
+def invalidate_catalogue():
+    """
+    Retire every cached catalogue page by bumping the version.
+    """
+    caches[PAGE_CACHE_ALIAS].set(CATALOGUE_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def render_cached(key, template_name, get_context, timeout, version=None):
+    """
+    Serve template_name from the body cached under key and version, or
+    render it from get_context() and cache it. The view sets any headers.
+
+    Cached bodies go to every user, so no request is passed in and no
+    context processor (user, csrf_token, messages) runs.
+    """
+    cache = caches[PAGE_CACHE_ALIAS]
+    content = cache.get(key, version=version)
+    if content is None:
+        content = render_to_string(template_name, get_context())
+        cache.set(key, content, timeout, version=version)
+    return HttpResponse(content)
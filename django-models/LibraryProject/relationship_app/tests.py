@@ -1,3 +1,172 @@
-from django.test import TestCase
+import io
+from contextlib import redirect_stdout
 
-# Create your tests here.
+from django.core.cache import caches
+from django.db import IntegrityError, transaction
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from . import query_samples, views
+from .models import Author, Book, Library
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class BookViewQueryTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        authors = Author.objects.bulk_create(
+            Author(name=f'Author {i}') for i in range(3)
+        )
+        cls.books = Book.objects.bulk_create(
+            Book(title=f'Book {i}', author=author, author_name=author.name)
+            for i, author in enumerate(authors)
+        )
+        cls.library = Library.objects.create(name='Central')
+        cls.library.books.set(cls.books)
+
+    def setUp(self):
+        # Rendered pages outlive each test's rollback, so start uncached.
+        caches['pages'].clear()
+
+    def test_list_books_reads_only_the_book_table(self):
+        # The page count and the page rows; no author queries.
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('relationship_app:list_books'))
+        self.assertContains(response, 'by Author 2')
+        self.assertContains(response, 'Total Books: 3')
+        self.assertEqual(
+            response.context['books'][0], {'title': 'Book 0', 'author_name': 'Author 0'}
+        )
+
+    def test_list_books_is_paginated(self):
+        author = self.books[0].author
+        Book.objects.bulk_create(
+            Book(title=f'Extra {i}', author=author, author_name=author.name)
+            for i in range(views.BOOKS_PER_PAGE)
+        )
+        response = self.client.get(reverse('relationship_app:list_books'), {'page': 2})
+        self.assertEqual(len(response.context['books']), 3)
+        self.assertContains(response, 'Page 2 of 2')
+
+    def test_list_books_is_served_from_cache(self):
+        self.client.get(reverse('relationship_app:list_books'))
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('relationship_app:list_books'))
+        self.assertContains(response, 'by Author 2')
+
+    def test_book_change_invalidates_cached_list(self):
+        self.client.get(reverse('relationship_app:list_books'))
+        Book.objects.create(title='Fresh Book', author=self.books[0].author)
+        response = self.client.get(reverse('relationship_app:list_books'))
+        self.assertContains(response, 'Fresh Book')
+
+    def test_book_change_keeps_other_cached_pages(self):
+        caches['pages'].set('unrelated', 'kept')
+        Book.objects.create(title='Fresh Book', author=self.books[0].author)
+        self.assertEqual(caches['pages'].get('unrelated'), 'kept')
+
+    def test_shared_pages_render_without_request_context(self):
+        response = self.client.get(reverse('relationship_app:list_books'))
+        self.assertIsNone(response.context.get('user'))
+        self.assertIsNone(response.context.get('csrf_token'))
+
+    def test_list_books_is_not_cached_downstream(self):
+        response = self.client.get(reverse('relationship_app:list_books'))
+        self.assertEqual(response['Cache-Control'], 'max-age=0')
+
+    def test_list_books_renders_uncached_for_odd_page_values(self):
+        response = self.client.get(reverse('relationship_app:list_books'), {'page': 'x' * 300})
+        self.assertContains(response, 'by Author 0')
+
+    def test_renaming_author_updates_book_author_name(self):
+        author = self.books[0].author
+        author.name = 'Renamed'
+        author.save()
+        self.assertEqual(Book.objects.get(pk=self.books[0].pk).author_name, 'Renamed')
+
+    def test_saving_book_copies_author_name(self):
+        book = Book.objects.create(title='New', author=self.books[1].author)
+        self.assertEqual(book.author_name, 'Author 1')
+
+    def test_saving_book_without_author_is_rejected_by_database(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Book.objects.create(title='Orphan')
+
+    def test_saving_book_without_author_change_skips_author_lookup(self):
+        book = Book.objects.get(pk=self.books[0].pk)
+        book.title = 'Retitled'
+        with self.assertNumQueries(1):
+            book.save()
+
+    def test_changing_author_id_refreshes_author_name(self):
+        book = Book.objects.get(pk=self.books[0].pk)
+        book.author_id = self.books[2].author_id
+        book.save()
+        self.assertEqual(Book.objects.get(pk=book.pk).author_name, 'Author 2')
+
+    def test_update_fields_with_author_saves_author_name(self):
+        book = Book.objects.get(pk=self.books[0].pk)
+        book.author = self.books[1].author
+        book.save(update_fields=['author'])
+        self.assertEqual(Book.objects.get(pk=book.pk).author_name, 'Author 1')
+
+    def test_library_detail_counts_books(self):
+        response = self.client.get(
+            reverse('relationship_app:library_detail', args=[self.library.pk])
+        )
+        self.assertEqual(response.context['books_count'], 3)
+
+    def test_library_detail_prefetches_books_and_authors(self):
+        # The library, then its prefetched books.
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse('relationship_app:library_detail', args=[self.library.pk])
+            )
+        self.assertContains(response, 'by Author 2')
+
+
+class QuerySamplesTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        with redirect_stdout(io.StringIO()):
+            query_samples.create_sample_data()
+
+    def test_all_library_data_takes_one_query_per_section(self):
+        out = io.StringIO()
+        with self.assertNumQueries(3), redirect_stdout(out):
+            query_samples.query_all_library_data()
+        self.assertIn('Central Library (4 books, Librarian: Alice Johnson)', out.getvalue())
+
+    def test_books_in_library_is_one_query(self):
+        out = io.StringIO()
+        with self.assertNumQueries(1), redirect_stdout(out):
+            books = query_samples.query_books_in_library('Downtown Library')
+        self.assertEqual(len(books), 2)
+        self.assertIn('A Game of Thrones (Author: George R.R. Martin)', out.getvalue())
+
+    def test_books_in_missing_library(self):
+        with redirect_stdout(io.StringIO()):
+            self.assertIsNone(query_samples.query_books_in_library('Nowhere'))
+
+    def test_libraries_by_book(self):
+        out = io.StringIO()
+        with self.assertNumQueries(2), redirect_stdout(out):
+            query_samples.query_libraries_by_book('A Game of Thrones')
+        self.assertIn('Available in 2 libraries:', out.getvalue())
+
+    def test_books_by_author_in_library(self):
+        out = io.StringIO()
+        # Author, library, then the matching books.
+        with self.assertNumQueries(3), redirect_stdout(out):
+            query_samples.query_all_books_by_author_in_library('J.K. Rowling', 'Downtown Library')
+        self.assertIn('Matching books: 1', out.getvalue())
+
+    def test_create_sample_data_is_idempotent(self):
+        with redirect_stdout(io.StringIO()):
+            query_samples.create_sample_data()
+        self.assertEqual(Author.objects.count(), 3)
+        self.assertEqual(Book.objects.count(), 4)
+        self.assertEqual(Library.objects.count(), 2)
+        self.assertEqual(Book.objects.get(title='A Game of Thrones').author_name, 'George R.R. Martin')